@@ -6,6 +6,7 @@ and provides typed configuration objects.
 """
 
 import os
+import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
@@ -13,6 +14,11 @@ from typing import Optional
 from dotenv import load_dotenv
 
 
+# Hex formats for Ethereum addresses and private keys
+_ADDR_RE = re.compile(r"^0x[0-9a-fA-F]{40}$")
+_KEY_RE = re.compile(r"^0x[0-9a-fA-F]{64}$")
+
+
 @dataclass
 class TradingConfig:
     """Trading-specific configuration."""
@@ -34,7 +40,7 @@ class TradingConfig:
         if not (0 < self.slippage_tolerance <= 1):
             raise ValueError("Slippage tolerance must be between 0 and 1")
         
-        if not self.wallet_address.startswith("0x"):
+        if not _ADDR_RE.fullmatch(self.wallet_address):
             raise ValueError("Invalid wallet address format")
 
 
@@ -48,10 +54,10 @@ class HyperliquidConfig:
     
     def __post_init__(self):
         """Validate configuration values."""
-        if not self.secret_key.startswith("0x"):
+        if not _KEY_RE.fullmatch(self.secret_key):
             raise ValueError("Invalid secret key format")
         
-        if self.account_address and not self.account_address.startswith("0x"):
+        if self.account_address and not _ADDR_RE.fullmatch(self.account_address):
             raise ValueError("Invalid account address format")
         
         if self.network not in ("mainnet", "testnet"):
@@ -6,20 +6,75 @@ connections to the Hyperliquid exchange API using environment variables.
 """
 
 import os
-from typing import Optional, Tuple
+from functools import lru_cache
+from typing import Any, Optional, Tuple
 
 import eth_account
+import orjson
+import requests
 from dotenv import load_dotenv
 from eth_account.signers.local import LocalAccount
 from hyperliquid.exchange import Exchange
 from hyperliquid.info import Info
 from hyperliquid.utils import constants
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 # Load environment variables from .env file
 load_dotenv()
 
 
+class FastInfo(Info):
+    """Info client that decodes API responses with orjson."""
+    
+    def __init__(self, *args: Any, **kwargs: Any):
+        """
+        Initialize the Info client.
+        
+        The SDK starts its WebSocket thread before fetching metadata; that
+        thread is not a daemon, so it is stopped here if setup fails.
+        """
+        try:
+            super().__init__(*args, **kwargs)
+        except BaseException:
+            ws_manager = getattr(self, "ws_manager", None)
+            if ws_manager is not None:
+                ws_manager.stop()
+            raise
+    
+    def disconnect_websocket(self):
+        """Stop the WebSocket thread, if one was started."""
+        if getattr(self, "ws_manager", None) is not None:
+            super().disconnect_websocket()
+    
+    def post(self, url_path: str, payload: Any = None) -> Any:
+        """
+        Send a POST request and decode the JSON response.
+        
+        Mirrors the SDK implementation, swapping the stdlib JSON decoder
+        for orjson on the response body.
+        
+        Args:
+            url_path: API path relative to the base URL
+            payload: Request payload
+            
+        Returns:
+            Decoded response body
+        """
+        payload = payload or {}
+        url = self.base_url + url_path
+        response = self.session.post(
+            url, json=payload, timeout=getattr(self, "timeout", None)
+        )
+        self._handle_exception(response)
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            return {"error": f"Could not parse JSON: {response.text}"}
+
+
+@lru_cache(maxsize=None)
 def get_base_url(network: str = "mainnet") -> str:
     """
     Get the Hyperliquid API base URL based on network.
@@ -35,6 +90,46 @@ def get_base_url(network: str = "mainnet") -> str:
     return constants.MAINNET_API_URL
 
 
+@lru_cache(maxsize=4)
+def _account_from_key(secret_key: str) -> LocalAccount:
+    """
+    Derive an account from a private key, memoized across setup() calls.
+    
+    Args:
+        secret_key: Hex-encoded private key
+        
+    Returns:
+        Local account for signing
+    """
+    return eth_account.Account.from_key(secret_key)
+
+
+def _build_session(headers: Optional[dict] = None) -> requests.Session:
+    """
+    Build a pooled HTTP session shared by all API clients.
+    
+    Only connection failures (raised before a request is sent) are
+    retried, so signed orders are never sent twice.
+    
+    Args:
+        headers: Default headers to carry over
+        
+    Returns:
+        Configured requests session
+    """
+    session = requests.Session()
+    if headers:
+        session.headers.update(headers)
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, read=0, other=0, status=0, backoff_factor=0.2)
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 def setup(
     base_url: Optional[str] = None,
     skip_ws: bool = False,
@@ -66,7 +161,7 @@ def setup(
     address = os.getenv("HL_ACCOUNT_ADDRESS", "")
     
     # Create account from private key
-    account: LocalAccount = eth_account.Account.from_key(secret_key)
+    account: LocalAccount = _account_from_key(secret_key)
     
     # Use account address if not provided in env
     if not address:
@@ -82,21 +177,33 @@ def setup(
         base_url = get_base_url(network)
     
     # Initialize API clients
-    info = Info(base_url, skip_ws)
-    
-    # Verify account has equity
-    user_state = info.user_state(address)
-    spot_user_state = info.spot_user_state(address)
-    margin_summary = user_state["marginSummary"]
-    
-    if float(margin_summary["accountValue"]) == 0 and len(spot_user_state["balances"]) == 0:
-        url = info.base_url.split(".", 1)[1]
-        error_string = (
-            f"Account {address} has no equity on {url}.\n"
-            "If this address is your API wallet, update HL_ACCOUNT_ADDRESS "
-            "to specify your actual account address."
-        )
-        raise Exception(error_string)
+    info = FastInfo(base_url, skip_ws)
+    
+    # The WebSocket thread keeps the process alive, so stop it on any failure
+    try:
+        session = _build_session(info.session.headers)
+        info.session = session
+        
+        # Verify account has equity (spot balances are only checked without perp equity)
+        user_state = info.user_state(address)
+        account_value = float(user_state["marginSummary"]["accountValue"])
+        
+        if account_value == 0 and len(info.spot_user_state(address)["balances"]) == 0:
+            url = info.base_url.split(".", 1)[1]
+            error_string = (
+                f"Account {address} has no equity on {url}.\n"
+                "If this address is your API wallet, update HL_ACCOUNT_ADDRESS "
+                "to specify your actual account address."
+            )
+            raise Exception(error_string)
+        
+        exchange = Exchange(account, base_url, account_address=address)
+        
+        # Share one keep-alive connection pool across every client
+        exchange.session = session
+        exchange.info.session = session
+    except BaseException:
+        info.disconnect_websocket()
+        raise
     
-    exchange = Exchange(account, base_url, account_address=address)
     return address, info, exchange
\ No newline at end of file
@@ -5,9 +5,8 @@ Provides consistent logging with emoji indicators and color support.
 """
 
 import sys
-from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Dict, Optional
 
 
 class LogLevel(Enum):
@@ -43,6 +42,17 @@ class Logger:
         """
         self.name = name
         self.use_emojis = use_emojis
+        
+        # Per-level prefixes and stream choice, resolved once
+        self._emoji_prefix: Dict[LogLevel, str] = {
+            level: f"{emoji}  " for level, emoji in self.EMOJIS.items() if emoji
+        }
+        self._bracket_prefix: Dict[LogLevel, str] = {
+            level: f"[{level.value}] " for level in LogLevel
+        }
+        self._is_error: Dict[LogLevel, bool] = {
+            level: level in (LogLevel.ERROR, LogLevel.CRITICAL) for level in LogLevel
+        }
     
     def _log(self, level: LogLevel, message: str, emoji_override: Optional[str] = None):
         """
@@ -53,17 +63,15 @@ class Logger:
             message: Log message
             emoji_override: Optional emoji to use instead of default
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        emoji = emoji_override if emoji_override else self.EMOJIS.get(level, "")
-        
-        if self.use_emojis and emoji:
-            log_msg = f"{emoji}  {message}"
+        if self.use_emojis and emoji_override:
+            prefix = f"{emoji_override}  "
+        elif self.use_emojis and level in self._emoji_prefix:
+            prefix = self._emoji_prefix[level]
         else:
-            log_msg = f"[{level.value}] {message}"
+            prefix = self._bracket_prefix[level]
         
         # Write to appropriate stream
-        stream = sys.stderr if level in (LogLevel.ERROR, LogLevel.CRITICAL) else sys.stdout
-        print(log_msg, file=stream)
+        print(prefix + message, file=sys.stderr if self._is_error[level] else sys.stdout)
     
     def debug(self, message: str):
         """Log debug message."""
@@ -152,6 +160,11 @@ class Logger:
         """Clear the terminal screen."""
         print("\033c", end="")
     
+    @staticmethod
+    def redraw_screen():
+        """Move the cursor home and clear below it, without a full terminal reset."""
+        sys.stdout.write("\033[H\033[J")
+    
     @staticmethod
     def separator(char: str = "=", length: int = 50):
         """Print a separator line."""
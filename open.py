@@ -5,22 +5,62 @@ A professional copy trading bot that monitors specified vault addresses
 and automatically replicates their trading positions on Hyperliquid exchange.
 """
 
+import os
 import sys
+import threading
 import time
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from tabulate import tabulate
 
 import hyperliquid_client
 from config import Config
 from logger import logger
-from trading import PositionManager, PriceCalculator, TradeExecutor
+from trading import PositionManager, PositionTable, PriceCalculator, TradeExecutor
+
+
+def _render_table(rows: List[List[str]], headers: List[str]) -> str:
+    """
+    Render rows as a box-drawn grid in the style of tabulate's fancy_grid.
+    
+    Args:
+        rows: Table rows of preformatted cell strings
+        headers: Column headers
+        
+    Returns:
+        Rendered table
+    """
+    widths = [max(len(str(cell)) for cell in col) for col in zip(headers, *rows)]
+    
+    def rule(left: str, fill: str, mid: str, right: str) -> str:
+        return left + mid.join(fill * (w + 2) for w in widths) + right
+    
+    def line(cells: List[str]) -> str:
+        return "│ " + " │ ".join(str(c).ljust(w) for c, w in zip(cells, widths)) + " │"
+    
+    row_sep = "\n" + rule("├", "─", "┼", "┤") + "\n"
+    return "\n".join([
+        rule("╒", "═", "╤", "╕"),
+        line(headers),
+        rule("╞", "═", "╪", "╡"),
+        row_sep.join(line(row) for row in rows),
+        rule("╘", "═", "╧", "╛"),
+    ])
 
 
 class CopyTradingBot:
     """Main copy trading bot class for managing position replication."""
     
+    # Tables at least this long compute their numeric columns with numpy
+    NUMPY_MIN_ROWS = 8
+    
+    # Render the positions table with tabulate instead of _render_table
+    USE_TABULATE = False
+    
+    # Seconds between vaults file modification checks
+    VAULTS_WATCH_INTERVAL = 0.1
+    
     def __init__(self, config: Config):
         """
         Initialize the copy trading bot.
@@ -31,23 +71,99 @@ class CopyTradingBot:
         self.config = config
         
         # Initialize Hyperliquid connection
-        self.address, self.info, self.exchange = hyperliquid_client.setup(skip_ws=True)
-        
-        # Initialize trading components
-        self.position_manager = PositionManager(self.info)
-        self.price_calculator = PriceCalculator(self.exchange)
-        self.trade_executor = TradeExecutor(
-            self.exchange,
-            config.trading.slippage_tolerance
-        )
+        self.address, self.info, self.exchange = hyperliquid_client.setup(skip_ws=False)
         
         # State management
-        self.my_positions: List[Dict] = []
+        self.my_positions = PositionTable()
         self.copy_vaults: List[str] = []
         self.old_vaults: List[str] = []
-        self.all_copy_positions: List[Dict] = []
+        self.all_copy_positions = PositionTable()
         
-
+        # Vaults file cache (re-read only when mtime changes)
+        self._vaults_mtime: float = 0
+        self._vaults_cache: List[str] = []
+        
+        # Key of the last rendered positions table (skip redraw if unchanged)
+        self._last_table_key: Optional[int] = None
+        
+        # Set by WebSocket handlers and the vaults file watcher to run the
+        # next tick immediately
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._vaults_watcher: Optional[threading.Thread] = None
+        
+        # The SDK's WebSocket thread is not a daemon; stop it if anything
+        # below fails so the process can exit
+        try:
+            # Initialize trading components
+            # Pushed positions older than two ticks fall back to REST, since
+            # the SDK never reconnects a dropped socket
+            self.position_manager = PositionManager(
+                self.info,
+                cache_ttl=2 * config.trading.refresh_interval
+            )
+            self.price_calculator = PriceCalculator(self.exchange)
+            self.trade_executor = TradeExecutor(
+                self.exchange,
+                config.trading.slippage_tolerance
+            )
+            
+            try:
+                self.info.subscribe({"type": "allMids"}, self._on_mids)
+            except Exception as e:
+                logger.warning(f"Could not subscribe to mids, polling instead: {e}")
+        except BaseException:
+            self.shutdown()
+            raise
+    
+    def _on_mids(self, msg: Dict):
+        """Store pushed mid prices for position sizing."""
+        self.price_calculator.update_mids(msg["data"]["mids"])
+    
+    def _watch_wallets(self):
+        """Subscribe to position updates for copied vaults and our wallet."""
+        self.position_manager.watch(
+            self.copy_vaults + [self.config.trading.wallet_address],
+            self._wake.set
+        )
+    
+    def _watch_vaults_file(self):
+        """Wake the main loop as soon as the vaults file is modified."""
+        vaults_file = self.config.trading.vaults_file
+        
+        def current_mtime() -> Optional[float]:
+            try:
+                return os.stat(vaults_file).st_mtime
+            except OSError:
+                return None
+        
+        last_mtime = current_mtime()
+        while not self._stop.wait(self.VAULTS_WATCH_INTERVAL):
+            mtime = current_mtime()
+            if mtime != last_mtime:
+                last_mtime = mtime
+                self._wake.set()
+    
+    def _start_vaults_watcher(self):
+        """Start the background vaults file watcher if not running."""
+        if self._vaults_watcher is not None:
+            return
+        self._vaults_watcher = threading.Thread(
+            target=self._watch_vaults_file,
+            name="vaults-watcher",
+            daemon=True
+        )
+        self._vaults_watcher.start()
+    
+    def shutdown(self):
+        """Release background resources before exiting; safe to call twice."""
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        try:
+            self.info.disconnect_websocket()
+        except Exception as e:
+            logger.warning(f"Could not close WebSocket cleanly: {e}")
     
     def print_positions_table(self):
         """Print formatted table of current positions."""
@@ -55,51 +171,98 @@ class CopyTradingBot:
             logger.chart("No open positions")
             return
         
-        table_data = []
-        for pos in self.my_positions:
-            coin = pos["coin"]
-            size = float(pos["szi"])
-            pnl_pct = (
-                float(pos["unrealizedPnl"]) / float(pos["positionValue"]) * 100
-            )
-            value = float(pos["positionValue"])
-            leverage = pos["leverage"]["value"]
+        positions = self.my_positions.values()
+        if len(positions) >= self.NUMPY_MIN_ROWS:
+            # Convert and divide column-wise for larger tables
+            import numpy as np
             
-            table_data.append([
-                coin,
+            count = len(positions)
+            sizes = np.fromiter((float(p["szi"]) for p in positions), np.float64, count)
+            pnls = np.fromiter((float(p["unrealizedPnl"]) for p in positions), np.float64, count)
+            values = np.fromiter((float(p["positionValue"]) for p in positions), np.float64, count)
+            pnl_pcts = np.divide(pnls, values, out=np.zeros(count), where=values != 0) * 100
+        else:
+            sizes = [float(p["szi"]) for p in positions]
+            values = [float(p["positionValue"]) for p in positions]
+            pnl_pcts = [
+                float(p["unrealizedPnl"]) / value * 100 if value else 0.0
+                for p, value in zip(positions, values)
+            ]
+        
+        table_data = [
+            [
+                pos["coin"],
                 f"{size:+.4f}",
                 f"{pnl_pct:+.2f}%",
                 f"${value:,.2f}",
-                f"{leverage}x"
-            ])
+                f"{pos['leverage']['value']}x"
+            ]
+            for pos, size, pnl_pct, value in zip(positions, sizes, pnl_pcts, values)
+        ]
         
         headers = ["Coin", "Size", "PnL", "Value (USD)", "Leverage"]
-        print(tabulate(table_data, headers=headers, tablefmt="fancy_grid"))
+        if self.USE_TABULATE:
+            print(tabulate(table_data, headers=headers, tablefmt="fancy_grid"))
+        else:
+            print(_render_table(table_data, headers))
         
         print("\n📋 Copying vaults:")
         for vault in self.copy_vaults:
             print(f"   • {vault}")
         print()
     
+    def refresh_display(self):
+        """Redraw the positions table in place, only if it changed."""
+        table_key = hash((
+            tuple(
+                (p["coin"], p["szi"], p["unrealizedPnl"], p["positionValue"])
+                for p in self.my_positions
+            ),
+            tuple(self.copy_vaults)
+        ))
+        if table_key == self._last_table_key:
+            return
+        self._last_table_key = table_key
+        
+        logger.redraw_screen()
+        self.print_positions_table()
+        logger.waiting("Waiting for updates...")
+        sys.stdout.flush()
+    
     def load_copy_vaults(self) -> List[str]:
         """
         Load vault addresses from file.
         
+        The file is only re-read when its modification time changes;
+        otherwise the cached list from the previous read is returned.
+        
         Returns:
             List of vault addresses
         """
         vaults_file = self.config.trading.vaults_file
         try:
-            with open(vaults_file, 'r') as f:
-                vaults = [line.strip() for line in f if line.strip()]
-            return vaults
+            st = os.stat(vaults_file)
+            if st.st_mtime == self._vaults_mtime:
+                return self._vaults_cache
+            
+            # Single read, single decode; addresses are plain ASCII
+            lines = Path(vaults_file).read_bytes().decode("ascii", "ignore").splitlines()
+            vaults = [line for line in map(str.strip, lines) if line]
+            # Keep the cached object when only the mtime changed
+            if vaults != self._vaults_cache:
+                self._vaults_cache = vaults
+            self._vaults_mtime = st.st_mtime
+            return self._vaults_cache
         except FileNotFoundError:
             logger.warning(f"{vaults_file} not found. Creating empty file.")
             Path(vaults_file).touch()
-            return []
         except Exception as e:
             logger.error(f"Failed to load vaults file", exc_info=e)
-            return []
+        
+        if self._vaults_cache:
+            self._vaults_cache = []
+        self._vaults_mtime = 0
+        return self._vaults_cache
     
     def run(self):
         """Main bot loop - monitor and copy positions."""
@@ -108,41 +271,42 @@ class CopyTradingBot:
         logger.money(f"Trade amount: ${self.config.trading.trade_amount_usd}")
         logger.update(f"Refresh interval: {self.config.trading.refresh_interval}s\n")
         
-        # Initial load
-        self.copy_vaults = self.load_copy_vaults()
-        self.old_vaults = self.copy_vaults[:]
-        self.my_positions = self.position_manager.get_positions(
-            self.config.trading.wallet_address
-        )
-        
-        self.print_positions_table()
-        
         try:
+            # Initial load
+            self.copy_vaults = self.load_copy_vaults()
+            self.old_vaults = self.copy_vaults
+            self._watch_wallets()
+            self._start_vaults_watcher()
+            self.my_positions = PositionTable(self.position_manager.get_positions(
+                self.config.trading.wallet_address, use_cache=False
+            ))
+            
+            self.print_positions_table()
+            
             while True:
                 # Reload vaults list (allows runtime updates)
                 self.copy_vaults = self.load_copy_vaults()
                 
-                if self.copy_vaults != self.old_vaults:
+                # Cached list is returned unchanged, so identity suffices
+                if self.copy_vaults is not self.old_vaults:
                     logger.update("Copy vaults list updated")
-                    self.all_copy_positions = []
-                    self.old_vaults = self.copy_vaults[:]
+                    self.old_vaults = self.copy_vaults
+                    self._watch_wallets()
                 
                 # Aggregate positions from all vaults
-                self.all_copy_positions = []
+                self.all_copy_positions.clear()
+                vaults_positions = self.position_manager.get_positions_bulk(
+                    self.copy_vaults
+                )
                 for vault in self.copy_vaults:
-                    vault_positions = self.position_manager.get_positions(vault)
+                    vault_positions = vaults_positions[vault]
                     for position in vault_positions:
                         # Add if not already tracked
-                        if not self.position_manager.has_coin_position(
-                            self.all_copy_positions, position['coin']
-                        ):
-                            self.all_copy_positions.append(position)
+                        self.all_copy_positions.add(position)
                     
                     # Check for new positions to open
                     for position in vault_positions:
-                        if not self.position_manager.has_coin_position(
-                            self.my_positions, position['coin']
-                        ):
+                        if position['coin'] not in self.my_positions:
                             logger.separator()
                             logger.new_position("NEW POSITION DETECTED")
                             logger.separator()
@@ -178,22 +342,30 @@ class CopyTradingBot:
                                 time.sleep(1)
                 
                 # Close positions that are no longer in any vault
-                for my_position in self.my_positions[:]:
-                    if not self.position_manager.has_coin_position(
-                        self.all_copy_positions, my_position['coin']
-                    ):
-                        logger.trade_close(f"Closing position on {my_position['coin']}")
-                        self.trade_executor.close_position(my_position['coin'])
+                to_close = [
+                    my_position['coin']
+                    for my_position in self.my_positions.iter_new_vs(
+                        self.all_copy_positions
+                    )
+                ]
+                for coin in to_close:
+                    logger.trade_close(f"Closing position on {coin}")
+                self.trade_executor.close_positions(to_close)
                 
-                # Refresh positions and display
-                self.my_positions = self.position_manager.get_positions(
-                    self.config.trading.wallet_address
-                )
-                logger.clear_screen()
-                self.print_positions_table()
-                logger.waiting("Waiting for updates...")
+                # Trades move the market; don't reuse this tick's mids
+                self.price_calculator.invalidate()
+                
+                # Refresh positions and display (always over REST, so a
+                # push predating our own trades can't trigger a re-open)
+                self.my_positions = PositionTable(self.position_manager.get_positions(
+                    self.config.trading.wallet_address, use_cache=False
+                ))
+                self.refresh_display()
                 
-                time.sleep(self.config.trading.refresh_interval)
+                # Wait for a pushed change or vaults file edit, polling at
+                # refresh_interval
+                self._wake.wait(self.config.trading.refresh_interval)
+                self._wake.clear()
                 
         except KeyboardInterrupt:
             logger.info("\n\nBot stopped by user", emoji="🛑")
@@ -201,10 +373,13 @@ class CopyTradingBot:
         except Exception as e:
             logger.critical("\n\nFatal error occurred", exc_info=e)
             sys.exit(1)
+        finally:
+            self.shutdown()
 
 
 def main():
     """Main entry point."""
+    bot = None
     try:
         # Load configuration
         config = Config()
@@ -222,6 +397,10 @@ def main():
     except Exception as e:
         logger.critical("Failed to start bot", exc_info=e)
         sys.exit(1)
+    finally:
+        # Background threads would otherwise keep the process alive
+        if bot is not None:
+            bot.shutdown()
 
 
 if __name__ == "__main__":
@@ -4,7 +4,11 @@ Trading operations and position management for HLCopy bot.
 Handles all trading logic including position opening, closing, and monitoring.
 """
 
-from typing import Dict, List, Optional
+import operator
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 from hyperliquid.exchange import Exchange
 from hyperliquid.info import Info
@@ -12,48 +16,257 @@ from hyperliquid.info import Info
 from logger import logger
 
 
+# Sort key for position lists
+_coin_key = operator.itemgetter("coin")
+
+
+class PositionTable:
+    """Positions indexed by coin for constant-time lookups."""
+    
+    def __init__(self, positions: Iterable[Dict] = ()):
+        """
+        Initialize position table.
+        
+        Args:
+            positions: Initial positions; the first one seen per coin wins
+        """
+        self._by_coin: Dict[str, Dict] = {}
+        for position in positions:
+            self.add(position)
+    
+    def __contains__(self, coin: str) -> bool:
+        return coin in self._by_coin
+    
+    def __iter__(self) -> Iterator[Dict]:
+        return iter(self._by_coin.values())
+    
+    def __len__(self) -> int:
+        return len(self._by_coin)
+    
+    def has(self, coin: str) -> bool:
+        """Check if a position for a coin is tracked."""
+        return coin in self._by_coin
+    
+    def get(self, coin: str) -> Optional[Dict]:
+        """Get the position for a coin, or None if not tracked."""
+        return self._by_coin.get(coin)
+    
+    def add(self, position: Dict) -> bool:
+        """
+        Track a position unless its coin is already tracked.
+        
+        Args:
+            position: Position dictionary
+            
+        Returns:
+            True if the position was added
+        """
+        coin = position["coin"]
+        if coin in self._by_coin:
+            return False
+        self._by_coin[coin] = position
+        return True
+    
+    def remove(self, coin: str) -> Optional[Dict]:
+        """Stop tracking a coin and return its position, if any."""
+        return self._by_coin.pop(coin, None)
+    
+    def clear(self):
+        """Remove all positions."""
+        self._by_coin.clear()
+    
+    def coins(self) -> Set[str]:
+        """Get the set of tracked coins."""
+        return set(self._by_coin)
+    
+    def values(self) -> List[Dict]:
+        """Get tracked positions in insertion order."""
+        return list(self._by_coin.values())
+    
+    def iter_new_vs(self, other: "PositionTable") -> Iterator[Dict]:
+        """
+        Iterate positions whose coin is not tracked by another table.
+        
+        Args:
+            other: Table to compare against
+            
+        Yields:
+            Positions present here but missing from other
+        """
+        for coin, position in self._by_coin.items():
+            if coin not in other._by_coin:
+                yield position
+
+
 class PositionManager:
     """Manages position queries and operations."""
     
-    def __init__(self, info: Info):
+    # Upper bound on concurrent position requests
+    MAX_WORKERS = 32
+    
+    def __init__(self, info: Info, cache_ttl: float = 6.0):
         """
         Initialize position manager.
         
         Args:
             info: Hyperliquid Info instance
+            cache_ttl: Max age in seconds of WebSocket-pushed positions
+                before falling back to a REST request
         """
         self.info = info
+        self.cache_ttl = cache_ttl
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
+        # WebSocket-fed state: wallet -> (received_at, positions)
+        self._positions_cache: Dict[str, Tuple[float, List[Dict]]] = {}
+        self._subscriptions: Dict[str, int] = {}
+    
+    @staticmethod
+    def parse_positions(user_state: Dict) -> List[Dict]:
+        """
+        Extract positions from a clearinghouse state payload.
+        
+        Args:
+            user_state: User state as returned by user_state or webData2
+            
+        Returns:
+            List of position dictionaries with type ('long'/'short') added,
+            sorted by coin
+        """
+        positions = []
+        for asset_position in user_state["assetPositions"]:
+            position = asset_position["position"]
+            # Determine position type based on size
+            position["type"] = "long" if float(position["szi"]) > 0 else "short"
+            positions.append(position)
+        positions.sort(key=_coin_key)
+        return positions
     
-    def get_positions(self, wallet: str) -> List[Dict]:
+    def get_positions(self, wallet: str, use_cache: bool = True) -> List[Dict]:
         """
         Get all positions for a wallet address.
         
+        Positions pushed over WebSocket are returned while fresh; otherwise
+        they are fetched over REST.
+        
         Args:
             wallet: Wallet address
+            use_cache: Whether WebSocket-pushed positions may be used
             
         Returns:
             List of position dictionaries with type ('long'/'short') added
         """
+        if use_cache:
+            cached = self._positions_cache.get(wallet)
+            if cached and time.monotonic() - cached[0] <= self.cache_ttl:
+                return cached[1]
+        
         try:
-            user_state = self.info.user_state(wallet)
-            positions = []
-            
-            for asset_position in user_state["assetPositions"]:
-                position = asset_position["position"]
-                # Determine position type based on size
-                position["type"] = "long" if float(position["szi"]) > 0 else "short"
-                positions.append(position)
-            
-            return positions
+            return self.parse_positions(self.info.user_state(wallet))
             
         except Exception as e:
             logger.error(f"Failed to fetch positions for {wallet}", exc_info=e)
             return []
     
+    def watch(self, wallets: List[str], on_change: Callable[[], None]):
+        """
+        Keep WebSocket position subscriptions in sync with a wallet list.
+        
+        Args:
+            wallets: Wallet addresses to subscribe to
+            on_change: Called from the WebSocket thread when a wallet's
+                positions change
+        """
+        wanted = set(wallets)
+        
+        for wallet in list(self._subscriptions):
+            if wallet not in wanted:
+                try:
+                    self.info.unsubscribe(
+                        {"type": "webData2", "user": wallet},
+                        self._subscriptions[wallet]
+                    )
+                except Exception as e:
+                    logger.warning(f"Could not unsubscribe from {wallet}: {e}")
+                del self._subscriptions[wallet]
+                self._positions_cache.pop(wallet, None)
+        
+        for wallet in wanted:
+            if wallet in self._subscriptions:
+                continue
+            try:
+                self._subscriptions[wallet] = self.info.subscribe(
+                    {"type": "webData2", "user": wallet},
+                    lambda msg, wallet=wallet: self._on_user(wallet, msg, on_change)
+                )
+            except Exception as e:
+                logger.warning(f"Could not subscribe to {wallet}, polling instead: {e}")
+    
+    def _on_user(self, wallet: str, msg: Any, on_change: Callable[[], None]):
+        """
+        Handle a webData2 push for a wallet.
+        
+        Args:
+            wallet: Wallet address the subscription belongs to
+            msg: WebSocket message
+            on_change: Callback fired when sizes or coins changed
+        """
+        try:
+            positions = self.parse_positions(msg["data"]["clearinghouseState"])
+        except Exception as e:
+            logger.warning(f"Ignoring malformed update for {wallet}: {e}")
+            return
+        
+        previous = self._positions_cache.get(wallet)
+        self._positions_cache[wallet] = (time.monotonic(), positions)
+        
+        # PnL moves on every push; only wake the bot if holdings changed
+        key = [(p["coin"], p["szi"]) for p in positions]
+        if previous is None or key != [(p["coin"], p["szi"]) for p in previous[1]]:
+            on_change()
+    
+    def get_positions_bulk(self, wallets: List[str]) -> Dict[str, List[Dict]]:
+        """
+        Get positions for several wallet addresses concurrently.
+        
+        Args:
+            wallets: List of wallet addresses
+            
+        Returns:
+            Dict mapping each wallet address to its list of positions
+        """
+        if not wallets:
+            return {}
+        
+        # Reuse one pool across calls; threads are only spawned as needed
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.MAX_WORKERS,
+                thread_name_prefix="positions"
+            )
+        
+        results = self._executor.map(self.get_positions, wallets)
+        return dict(zip(wallets, results))
+    
+    def get_coin_set(self, positions: List[Dict]) -> Set[str]:
+        """
+        Build a set of coin symbols for fast membership tests.
+        
+        Args:
+            positions: List of positions
+            
+        Returns:
+            Set of coin symbols
+        """
+        return {pos["coin"] for pos in positions}
+    
     def has_coin_position(self, positions: List[Dict], coin: str) -> bool:
         """
         Check if a coin exists in positions list.
         
+        Deprecated: this is a linear scan. Build a PositionTable and test
+        membership with ``coin in table`` instead.
+        
         Args:
             positions: List of positions
             coin: Coin symbol
@@ -61,6 +274,11 @@ class PositionManager:
         Returns:
             True if coin is in positions
         """
+        warnings.warn(
+            "has_coin_position is deprecated; use PositionTable membership instead",
+            DeprecationWarning,
+            stacklevel=2
+        )
         return any(pos["coin"] == coin for pos in positions)
     
     def get_position_by_coin(self, positions: List[Dict], coin: str) -> Optional[Dict]:
@@ -91,11 +309,33 @@ class PriceCalculator:
             exchange: Hyperliquid Exchange instance
         """
         self.exchange = exchange
+        
+        # Short-lived mids snapshot shared by lookups within a tick
+        self._mids_cache: Optional[Dict] = None
+        self._mids_ts: float = 0.0
+        self._mids_ttl: float = 1.0
+    
+    def invalidate(self):
+        """Drop the cached mids snapshot so the next lookup refetches."""
+        self._mids_cache = None
+    
+    def update_mids(self, mids: Dict):
+        """
+        Replace the cached mids snapshot with a pushed one.
+        
+        Args:
+            mids: Mapping of coin symbol to mid price
+        """
+        self._mids_cache = mids
+        self._mids_ts = time.monotonic()
     
     def get_coin_price(self, coin: str) -> Optional[float]:
         """
         Get current market price for a coin.
         
+        The mids snapshot is cached for a short TTL so that several
+        lookups in the same tick share a single request.
+        
         Args:
             coin: Coin symbol
             
@@ -103,7 +343,12 @@ class PriceCalculator:
             Current price or None if unavailable
         """
         try:
-            mids = self.exchange.info.all_mids()
+            now = time.monotonic()
+            if self._mids_cache is None or now - self._mids_ts > self._mids_ttl:
+                self._mids_cache = self.exchange.info.all_mids()
+                self._mids_ts = now
+            
+            mids = self._mids_cache
             if coin not in mids:
                 logger.warning(f"Price not available for {coin}")
                 return None
@@ -234,3 +479,71 @@ class TradeExecutor:
         except Exception as e:
             logger.error(f"Failed to close position on {coin}", exc_info=e)
             return False
+    
+    def close_positions(self, coins: List[str]) -> bool:
+        """
+        Close several positions with a single signed bulk order.
+        
+        Builds one reduce-only IOC leg per coin, mirroring market_close,
+        and falls back to closing coins one by one if the batch fails.
+        
+        Args:
+            coins: Coin symbols to close
+            
+        Returns:
+            True if every position was closed, False otherwise
+        """
+        if not coins:
+            return True
+        if len(coins) == 1:
+            return self.close_position(coins[0])
+        
+        try:
+            address = self.exchange.account_address or self.exchange.wallet.address
+            user_state = self.exchange.info.user_state(address)
+            sizes = {
+                asset_position["position"]["coin"]: float(asset_position["position"]["szi"])
+                for asset_position in user_state["assetPositions"]
+            }
+            # One mids snapshot for every leg, instead of one fetch per coin
+            mids = self.exchange.info.all_mids()
+            
+            order_requests = []
+            for coin in coins:
+                szi = sizes.get(coin)
+                if not szi:
+                    logger.warning(f"No open position on {coin} to close")
+                    continue
+                is_buy = szi < 0
+                order_requests.append({
+                    "coin": coin,
+                    "is_buy": is_buy,
+                    "sz": abs(szi),
+                    # SDK-private helper (pinned via requirements.txt); it
+                    # applies the same slippage and tick rounding as market_close
+                    "limit_px": self.exchange._slippage_price(
+                        coin, is_buy, self.exchange.DEFAULT_SLIPPAGE, px=float(mids[coin])
+                    ),
+                    "order_type": {"limit": {"tif": "Ioc"}},
+                    "reduce_only": True,
+                })
+            
+            if not order_requests:
+                return True
+            
+            result = self.exchange.bulk_orders(order_requests)
+            if result["status"] != "ok":
+                raise RuntimeError(result)
+        except Exception as e:
+            logger.warning(f"Batch close failed, closing one by one: {e}")
+            return all([self.close_position(coin) for coin in coins])
+        
+        success = True
+        statuses = result["response"]["data"]["statuses"]
+        for order, status in zip(order_requests, statuses):
+            if "error" in status:
+                logger.error(f"Failed to close position on {order['coin']}: {status['error']}")
+                success = False
+            else:
+                logger.trade_close(f"Closed position on {order['coin']}")
+        return success